@@ -1,10 +1,14 @@
+import multiprocessing as mp
 import random
 
+import numpy as np
+
 
 def sample_gift_quality(
     base_range=(-0.5, 0.1),
     jackpot_prob=0.01,
-    jackpot_range=(0.9, 1.0)
+    jackpot_range=(0.9, 1.0),
+    rng=random
 ):
     """
     Sample a gift quality modifier with a small probability of a large
@@ -22,21 +26,66 @@ def sample_gift_quality(
         Probability that a jackpot bonus is applied.
     jackpot_range : tuple of float, optional
         Lower and upper bounds for the jackpot bonus.
+    rng : random.Random or module, optional
+        Source of the draws. Defaults to the global `random` module.
 
     Returns
     -------
     float
         The sampled quality modifier.
     """
-    base = random.uniform(*base_range)
+    uniform = rng.uniform
+    base = uniform(base_range[0], base_range[1])
 
-    if random.random() < jackpot_prob:
-        jackpot = random.uniform(*jackpot_range)
+    if rng.random() < jackpot_prob:
+        jackpot = uniform(jackpot_range[0], jackpot_range[1])
         return base + jackpot
 
     return base
 
 
+def sample_gift_qualities(
+    n,
+    rng,
+    base_range=(-0.5, 0.1),
+    jackpot_prob=0.01,
+    jackpot_range=(0.9, 1.0)
+):
+    """
+    Vectorized `sample_gift_quality`: draw `n` quality modifiers at once.
+
+    Bases, jackpot bonuses and jackpot hits are each drawn as one array and
+    combined with a mask, giving the same distribution as `n` calls to
+    `sample_gift_quality` but from the NumPy generator's stream.
+
+    Parameters
+    ----------
+    n : int
+        Number of qualities to draw.
+    rng : numpy.random.Generator
+        Generator supplying the draws.
+    base_range : tuple of float, optional
+        Lower and upper bounds for the base quality draw.
+    jackpot_prob : float, optional
+        Probability that a jackpot bonus is applied.
+    jackpot_range : tuple of float, optional
+        Lower and upper bounds for the jackpot bonus.
+
+    Returns
+    -------
+    numpy.ndarray
+        The sampled quality modifiers.
+    """
+    bases = rng.uniform(base_range[0], base_range[1], n)
+    jackpots = rng.uniform(jackpot_range[0], jackpot_range[1], n)
+    hit = rng.random(n) < jackpot_prob
+    return np.where(hit, bases + jackpots, bases)
+
+
+# Variant codes for the compiled kernel in white_elephant_numba.
+VARIANT_CODES = {'normal': 0, 'p1_extra_turn': 1, 'early_player_swaps': 2}
+
+
 # -------------------
 # Gift
 # -------------------
@@ -53,8 +102,6 @@ class Gift:
         Intrinsic quality modifier influencing player desirability.
     steal_count : int
         Number of times the gift has been stolen.
-    locked : bool
-        Whether the gift is currently locked and cannot be stolen.
     last_stolen_turn : int or None
         Turn index on which the gift was last stolen.
     lock_num : int
@@ -63,6 +110,15 @@ class Gift:
         Whether the gift has been unwrapped.
     """
 
+    __slots__ = (
+        'id',
+        'quality_modifier',
+        'steal_count',
+        'last_stolen_turn',
+        'lock_num',
+        'unwrapped',
+    )
+
     def __init__(self, gift_id, quality_modifier, lock_num=2):
         """
         Initialize a gift.
@@ -79,7 +135,6 @@ class Gift:
         self.id = gift_id
         self.quality_modifier = quality_modifier
         self.steal_count = 0
-        self.locked = False
         self.last_stolen_turn = None
         self.lock_num = lock_num
         self.unwrapped = False
@@ -88,8 +143,8 @@ class Gift:
         """
         Determine whether the gift can be stolen on the current turn.
 
-        A gift cannot be stolen if it is locked or if it was stolen on the
-        immediately preceding turn.
+        A gift cannot be stolen once it has reached `lock_num` steals or if it
+        was stolen on the immediately preceding turn.
 
         Parameters
         ----------
@@ -101,7 +156,7 @@ class Gift:
         bool
             True if the gift may be stolen, False otherwise.
         """
-        if self.locked:
+        if self.steal_count >= self.lock_num:
             return False
         if self.last_stolen_turn == current_turn - 1:
             return False
@@ -109,7 +164,7 @@ class Gift:
 
     def record_steal(self, current_turn):
         """
-        Record a steal event for the gift and update lock status.
+        Record a steal event for the gift.
 
         Parameters
         ----------
@@ -118,8 +173,6 @@ class Gift:
         """
         self.steal_count += 1
         self.last_stolen_turn = current_turn
-        if self.steal_count >= self.lock_num:
-            self.locked = True
 
 
 # -------------------
@@ -134,17 +187,39 @@ class Player:
     ----------
     id : int
         Unique identifier for the player.
-    desirabilities : dict[int, float]
-        Mapping from gift ID to desirability score.
+    desirabilities : numpy.ndarray
+        Desirability scores indexed by gift ID.
     threshold : float
         Minimum desirability required for the player to steal a gift.
-    gifts_held : list[int]
-        List of gift IDs currently owned by the player.
+    gift_held : int or None
+        ID of the gift currently owned by the player, if any.
     swap_card : bool
         Whether the player currently holds a swap card.
+    pref : numpy.ndarray
+        Gift IDs ordered from most to least desirable.
+    steal_targets : list[int]
+        Leading run of `pref` scoring above `threshold`: the only gifts the
+        player would ever steal.
     """
 
-    def __init__(self, player_id, desirabilities, threshold, swap_card=False):
+    __slots__ = (
+        'id',
+        'desirabilities',
+        'threshold',
+        'gift_held',
+        'swap_card',
+        'pref',
+        'steal_targets',
+    )
+
+    def __init__(
+        self,
+        player_id,
+        desirabilities,
+        threshold,
+        swap_card=False,
+        pref=None
+    ):
         """
         Initialize a player.
 
@@ -152,18 +227,26 @@ class Player:
         ----------
         player_id : int
             Unique identifier for the player.
-        desirabilities : dict[int, float]
-            Mapping from gift ID to desirability score.
+        desirabilities : numpy.ndarray
+            Desirability scores indexed by gift ID.
         threshold : float
             Desirability threshold for stealing behavior.
         swap_card : bool, optional
             Whether the player starts with a swap card.
+        pref : numpy.ndarray or None, optional
+            Precomputed preference order. Derived from `desirabilities`
+            if not given.
         """
         self.id = player_id
         self.desirabilities = desirabilities
         self.threshold = threshold
-        self.gifts_held = []
+        self.gift_held = None
         self.swap_card = swap_card
+        if pref is None:
+            pref = np.argsort(-desirabilities, kind='stable')
+        self.pref = pref
+        n_above = int(np.count_nonzero(desirabilities > threshold))
+        self.steal_targets = pref[:n_above].tolist()
 
     def desirability(self, gift_id):
         """
@@ -201,7 +284,8 @@ class WhiteElephantGame:
                  lock_num=2, 
                  variant='normal',
                  swap_card_thresh=3,
-                 verbose=False
+                 verbose=False,
+                 use_numba=False
                 ):
         """
         Initialize a White Elephant game instance.
@@ -221,9 +305,15 @@ class WhiteElephantGame:
         swap_card_thresh : int, optional
             Number of early players eligible for swap cards.
         verbose : bool, print more information about the game.
+        use_numba : bool, optional
+            Play `run` with the compiled kernel in `white_elephant_numba`
+            (requires numba). The kernel draws its own unwrap order, so
+            seeded games differ from the pure-Python engine.
         """
-        if seed is not None:
-            random.seed(seed)
+        # Per-instance streams, so interleaved or threaded games never
+        # disturb each other: stdlib for play, NumPy for vectorized setup.
+        self.rng = random.Random(seed)
+        self.np_rng = np.random.default_rng(seed)
 
         self.n_players = n_players
         self.round = 0
@@ -232,6 +322,7 @@ class WhiteElephantGame:
         self.verbose = verbose
         self.variant = variant
         self.swap_card_thresh = swap_card_thresh
+        self.use_numba = use_numba
         
         if variant not in ['p1_extra_turn','early_player_swaps']:
             variant = 'normal'
@@ -239,27 +330,29 @@ class WhiteElephantGame:
                 print('variant not recognized, playing normal game.')
 
         # Create gifts
+        if self.jackpot is False:
+            qualities = self.np_rng.uniform(-0.25, 0.25, n_players)
+        else:
+            qualities = sample_gift_qualities(
+                n_players, self.np_rng, base_range=(-0.25, 0.25)
+            )
+
         self.gifts = {}
         for i in range(n_players):
-            if self.jackpot is False:
-                quality = random.uniform(-0.25, 0.25)
-            else:
-                quality = sample_gift_quality(base_range=(-0.25, 0.25))
-            self.gifts[i] = Gift(i, quality, lock_num=self.lock_num)
+            self.gifts[i] = Gift(i, float(qualities[i]), lock_num=self.lock_num)
+
+        # Create players: row i holds player i's desirability for every gift
+        bases = self.np_rng.uniform(0.2, 0.8, (n_players, n_players))
+        noise = self.np_rng.uniform(-0.15, 0.15, (n_players, n_players))
+        desir = np.clip(bases + qualities[None, :] + noise, 0.0, 0.97)
+        thresholds = self.np_rng.uniform(0.7, 1.0, n_players)
+        self.desirabilities = desir
+        self.thresholds = thresholds
+        prefs = np.argsort(-desir, axis=1, kind='stable')
 
-        # Create players
         self.players = []
         for i in range(n_players):
-            desirabilities = {}
-            for g in self.gifts.values():
-                base = random.uniform(0.2, 0.8)
-                noise = random.uniform(-0.15, 0.15)
-                desirabilities[g.id] = min(
-                    0.97,
-                    max(0.0, base + g.quality_modifier + noise)
-                )
-
-            threshold = random.uniform(0.7, 1.0)
+            threshold = float(thresholds[i])
 
             if self.variant == "early_player_swaps" and i < self.swap_card_thresh:
                 swap_card = True
@@ -267,12 +360,20 @@ class WhiteElephantGame:
                 swap_card = False
 
             self.players.append(
-                Player(i, desirabilities, threshold, swap_card=swap_card)
+                Player(
+                    i, desir[i], threshold, swap_card=swap_card, pref=prefs[i]
+                )
             )
 
         self.wrapped_gifts = list(self.gifts.keys())
-        self.ownership = {}  # gift_id -> player
-        self.history = ''
+        self.owner = np.full(n_players, -1, dtype=np.int32)  # gift_id -> player_id
+        self.players_by_id = self.players
+        self.steal_counts = np.zeros(n_players, dtype=np.int32)  # mirrors Gift.steal_count
+        self.swap_card_holders = [p for p in self.players if p.swap_card]
+        self.active_gifts = set()  # held, not yet locked out
+        self.just_stolen = None  # gift the robbed player may not take back
+        self.history = []  # turn-by-turn log, recorded when verbose
+        self._finished = False
 
     def take_turn(self, player):
         """
@@ -280,27 +381,35 @@ class WhiteElephantGame:
 
         The player attempts to steal the most desirable available gift.
         If no acceptable gift is available, the player unwraps a new gift.
-        Steals may trigger recursive turns by robbed players.
+        Each steal hands the turn to the robbed player, and the chain
+        continues until someone unwraps.
 
         Parameters
         ----------
         player : Player
             The active player.
         """
-        gift_options = self.stealable_gifts(player)
-        best_gift = self.best_available_gift(player, gift_options)
+        while True:
+            best_gift = self.find_steal_target(player)
+            # The just-stolen exclusion only protects the robbed player's
+            # first decision.
+            self.just_stolen = None
 
-        if best_gift:
-            robbed_player = self.steal_gift(player, best_gift)
-            self.take_turn(robbed_player)
-        else:
-            self.unwrap_gift(player)
-            self.round += 1
+            if best_gift is None:
+                self.unwrap_gift(player)
+                self.round += 1
+                return
+
+            player = self.steal_gift(player, best_gift)
 
     def stealable_gifts(self, player):
         """
         Collect all gifts that the player may legally steal.
 
+        The gift stolen immediately before this call is excluded, so a
+        robbed player cannot take it straight back. Game state is not
+        modified, so this is safe to call for inspection mid-chain.
+
         Parameters
         ----------
         player : Player
@@ -311,59 +420,66 @@ class WhiteElephantGame:
         list[int]
             List of stealable gift IDs.
         """
-        gifts_to_steal = []
-        for other_player in self.players:
-            if other_player != player:
-                gifts_to_steal.extend(other_player.gifts_held)
+        return [
+            g for g in self.active_gifts
+            if g != player.gift_held and g != self.just_stolen
+        ]
 
-        gifts_to_steal = list(
-            filter(
-                lambda x: (not self.gifts[x].locked)
-                and (self.gifts[x].steal_count < self.lock_num),
-                gifts_to_steal,
-            )
-        )
+    def find_steal_target(self, player):
+        """
+        Determine the best available gift for a player to steal.
 
-        self.unlock_gifts()
-        return gifts_to_steal
+        Only the player's `steal_targets` are scanned, so the threshold
+        check is settled up front and a player with no gift above their
+        threshold returns immediately.
 
-    def unlock_gifts(self):
-        """
-        Unlock all gifts.
+        Parameters
+        ----------
+        player : Player
+            The player making the decision.
 
-        This is used to reset temporary lock states between steal evaluations.
+        Returns
+        -------
+        int or None
+            ID of the chosen gift, or None if no gift meets the threshold.
         """
-        for gift in self.gifts.values():
-            gift.locked = False
+        return self._best_stealable_for(
+            player, player.steal_targets, self.just_stolen
+        )
 
-    def best_available_gift(self, player, gift_options):
+    def _best_stealable_for(self, player, candidates, just_stolen, floor=None):
         """
-        Determine the best available gift for a player to steal.
+        Return the first stealable gift in `candidates`.
+
+        `candidates` must be in the player's preference order. When `floor`
+        is given, the walk stops as soon as scores drop to it, since nothing
+        further down can beat it.
 
         Parameters
         ----------
         player : Player
-            The player making the decision.
-        gift_options : list[int]
-            Candidate gift IDs.
+            The player choosing a gift.
+        candidates : iterable of int
+            Gift IDs to consider, most desirable first.
+        just_stolen : int or None
+            Gift the player may not take straight back, if any.
+        floor : float or None, optional
+            Desirability the chosen gift must exceed.
 
         Returns
         -------
         int or None
-            ID of the chosen gift, or None if no gift meets the threshold.
+            ID of the chosen gift, or None if no stealable gift qualifies.
         """
-        if gift_options:
-            best_gift = max(gift_options, key=lambda x: player.desirabilities[x])
-        else:
-            best_gift = None
+        active_gifts = self.active_gifts
+        desirabilities = player.desirabilities
+        for g in candidates:
+            if floor is not None and desirabilities[g] <= floor:
+                return None
+            if g in active_gifts and g != player.gift_held and g != just_stolen:
+                return int(g)
 
-        if best_gift:
-            if player.desirabilities[best_gift] > player.threshold:
-                return best_gift
-            else:
-                best_gift = None
-
-        return best_gift
+        return None
 
     def steal_gift(self, player, gift_id):
         """
@@ -381,17 +497,37 @@ class WhiteElephantGame:
         Player
             The player who was robbed.
         """
-        robbed_player = self.ownership[gift_id]
-        robbed_player.gifts_held.remove(gift_id)
+        robbed_player = self.players_by_id[self.owner[gift_id]]
+        robbed_player.gift_held = None
 
-        self.ownership[gift_id] = player
-        player.gifts_held.append(gift_id)
+        self.owner[gift_id] = player.id
+        player.gift_held = gift_id
 
-        self.gifts[gift_id].locked = True
-        self.gifts[gift_id].steal_count += 1
+        self.just_stolen = gift_id
+        self.count_steal(gift_id)
+
+        if self.verbose:
+            self.history.append(
+                f'player {player.id} steals gift {gift_id} '
+                f'from player {robbed_player.id}'
+            )
 
         return robbed_player
 
+    def count_steal(self, gift_id):
+        """
+        Charge a steal to a gift, retiring it from play once it locks.
+
+        Parameters
+        ----------
+        gift_id : int
+            ID of the gift being stolen or swapped for.
+        """
+        self.gifts[gift_id].steal_count += 1
+        self.steal_counts[gift_id] += 1
+        if self.steal_counts[gift_id] >= self.lock_num:
+            self.active_gifts.discard(gift_id)
+
     def unwrap_gift(self, player):
         """
         Unwrap a random remaining gift and assign it to the player.
@@ -401,11 +537,22 @@ class WhiteElephantGame:
         player : Player
             The player unwrapping the gift.
         """
-        unwrapped_gift = random.choice(self.wrapped_gifts)
-        self.wrapped_gifts.remove(unwrapped_gift)
-
-        self.ownership[unwrapped_gift] = player
-        player.gifts_held.append(unwrapped_gift)
+        # Order of the wrapped pile is irrelevant, so swap the pick to the
+        # end and pop it rather than paying for list.remove.
+        wrapped = self.wrapped_gifts
+        idx = self.rng.randrange(len(wrapped))
+        wrapped[idx], wrapped[-1] = wrapped[-1], wrapped[idx]
+        unwrapped_gift = wrapped.pop()
+
+        self.owner[unwrapped_gift] = player.id
+        player.gift_held = unwrapped_gift
+        if self.lock_num > 0:
+            self.active_gifts.add(unwrapped_gift)
+
+        if self.verbose:
+            self.history.append(
+                f'player {player.id} unwraps gift {unwrapped_gift}'
+            )
 
         if self.variant == "early_player_swaps":
             swapper = self.swap_check(unwrapped_gift)
@@ -424,33 +571,33 @@ class WhiteElephantGame:
             Gift ID to swap, or 'highest' to auto-select the best option.
         """
         if gift_to_swap == 'highest':
-            gift_to_swap = None
-            gift_options = self.stealable_gifts(swapper)
-
-            if gift_options:
-                best_gift = max(gift_options, key=lambda x: swapper.desirabilities[x])
-            else:
-                best_gift = None
-
-            if best_gift:
-                if swapper.desirabilities[best_gift] > swapper.desirabilities[swapper.gifts_held[0]]:
-                    gift_to_swap = best_gift
+            gift_to_swap = self._best_stealable_for(
+                swapper,
+                swapper.pref,
+                self.just_stolen,
+                floor=swapper.desirability(swapper.gift_held),
+            )
 
-            if gift_to_swap:
+            if gift_to_swap is not None:
                 self.swap_gift(swapper, gift_to_swap=gift_to_swap)
 
         else:
-            swappee = self.ownership[gift_to_swap]
-            swappee.gifts_held.remove(gift_to_swap)
+            swappee = self.players_by_id[self.owner[gift_to_swap]]
+            worse_gift = swapper.gift_held
 
-            self.ownership[gift_to_swap] = swapper
-            worse_gift = swapper.gifts_held.pop()
-            swapper.gifts_held.append(gift_to_swap)
+            self.owner[gift_to_swap] = swapper.id
+            swapper.gift_held = gift_to_swap
 
-            self.ownership[worse_gift] = swappee
-            swappee.gifts_held.append(worse_gift)
+            self.owner[worse_gift] = swappee.id
+            swappee.gift_held = worse_gift
 
-            self.gifts[gift_to_swap].steal_count += 1
+            self.count_steal(gift_to_swap)
+
+            if self.verbose:
+                self.history.append(
+                    f'player {swapper.id} swaps gift {worse_gift} '
+                    f'for gift {gift_to_swap} with player {swappee.id}'
+                )
 
     def swap_check(self, gift_id):
         """
@@ -466,17 +613,17 @@ class WhiteElephantGame:
         Player or None
             Player who executes the swap, if any.
         """
-        players_with_swaps = list(
-            filter(lambda x: x.swap_card and x.gifts_held != [], self.players)
-        )
-        #random.shuffle(players_with_swaps)
+        #self.rng.shuffle(self.swap_card_holders)
 
-        for player in players_with_swaps:
+        for player in self.swap_card_holders:
+            if player.gift_held is None:
+                continue
             if (
-                player.desirability(player.gifts_held[0]) < player.desirability(gift_id)
+                player.desirability(player.gift_held) < player.desirability(gift_id)
                 and (player.threshold - 0.05) < player.desirability(gift_id)
             ):
                 player.swap_card = False
+                self.swap_card_holders.remove(player)
                 return player
 
     def run(self):
@@ -486,10 +633,15 @@ class WhiteElephantGame:
         Executes one turn per player and applies any variant-specific
         post-round rules.
         """
-        if self.history == 'done':
+        if self._finished:
             print('Game complete. Look at results or start a new instance!')
             return
 
+        if self.use_numba and self.variant in VARIANT_CODES:
+            self._run_numba()
+            self._finished = True
+            return
+
         for player in self.players:
             self.take_turn(player)
 
@@ -497,4 +649,148 @@ class WhiteElephantGame:
             player_1 = self.players[0]
             self.swap_gift(player_1)
 
-        self.history = 'done'
+        self._finished = True
+
+    def history_text(self):
+        """
+        Return the recorded game log as a single string.
+
+        Only populated when the game was created with `verbose=True` and
+        played on the pure-Python engine.
+
+        Returns
+        -------
+        str
+            One line per steal, unwrap or swap, in the order they happened.
+        """
+        return '\n'.join(self.history)
+
+    def _run_numba(self):
+        """
+        Play the game with the compiled kernel and copy the final state
+        back onto the players and gifts.
+        """
+        from white_elephant_numba import run_game
+
+        owner, steal_counts, swap_cards = run_game(
+            self.desirabilities,
+            self.thresholds,
+            self.lock_num,
+            VARIANT_CODES[self.variant],
+            self.swap_card_thresh,
+            int(self.np_rng.integers(2**31 - 1)),
+        )
+
+        self.owner = owner
+        self.steal_counts = steal_counts
+        for gift_id, player_id in enumerate(owner.tolist()):
+            self.players_by_id[player_id].gift_held = gift_id
+            self.gifts[gift_id].steal_count = int(steal_counts[gift_id])
+            if steal_counts[gift_id] < self.lock_num:
+                self.active_gifts.add(gift_id)
+
+        for player, swap_card in zip(self.players, swap_cards.tolist()):
+            player.swap_card = swap_card
+        self.swap_card_holders = [p for p in self.players if p.swap_card]
+
+        self.wrapped_gifts = []
+        self.round = self.n_players
+
+
+# -------------------
+# Batch runs
+# -------------------
+
+def _extract_results(game):
+    """
+    Summarize a finished game as plain, picklable data.
+
+    Parameters
+    ----------
+    game : WhiteElephantGame
+        A game on which `run` has been called.
+
+    Returns
+    -------
+    dict
+        Per-player lists, indexed by turn position, of the gift held, its
+        desirability (**quality**), whether it is the player's favourite
+        gift (**best**) and whether it clears their threshold (**threshold**).
+    """
+    gifts = []
+    quality = []
+    best = []
+    threshold = []
+    for player in game.players:
+        desir = player.desirability(player.gift_held)
+        gifts.append(player.gift_held)
+        quality.append(float(desir))
+        best.append(bool(desir >= player.desirabilities.max()))
+        threshold.append(bool(desir > player.threshold))
+
+    return {
+        'gifts': gifts,
+        'quality': quality,
+        'best': best,
+        'threshold': threshold,
+    }
+
+
+def _run_one(args):
+    """
+    Play a single seeded game in a worker process.
+
+    Parameters
+    ----------
+    args : tuple
+        `(seed, game_kwargs)` passed to `WhiteElephantGame`.
+
+    Returns
+    -------
+    dict
+        Results from `_extract_results`, plus the seed used.
+    """
+    seed, game_kwargs = args
+    game = WhiteElephantGame(seed=seed, **game_kwargs)
+    game.run()
+
+    results = _extract_results(game)
+    results['seed'] = seed
+    return results
+
+
+def run_batch(n_reps, n_players, processes=None, seed=0, **game_kwargs):
+    """
+    Play many independent games in parallel across worker processes.
+
+    Game `i` is seeded with `seed + i`, so a batch is reproducible
+    regardless of how the games are scheduled. On platforms that spawn
+    workers (Windows, macOS) call this from under an
+    ``if __name__ == '__main__':`` guard.
+
+    Parameters
+    ----------
+    n_reps : int
+        Number of games to play.
+    n_players : int
+        Number of players (and gifts) in each game.
+    processes : int or None, optional
+        Number of worker processes. Defaults to the CPU count.
+    seed : int, optional
+        Seed of the first game in the batch.
+    **game_kwargs
+        Further keyword arguments passed to `WhiteElephantGame`
+        (e.g. `jackpot`, `lock_num`, `variant`).
+
+    Returns
+    -------
+    list[dict]
+        One result dict per game, in completion order. Each carries its
+        `seed` alongside the per-player lists from `_extract_results`.
+    """
+    game_kwargs['n_players'] = n_players
+    jobs = [(seed + i, game_kwargs) for i in range(n_reps)]
+    chunksize = max(1, n_reps // (4 * (processes or mp.cpu_count())))
+
+    with mp.Pool(processes) as pool:
+        return list(pool.imap_unordered(_run_one, jobs, chunksize=chunksize))
@@ -0,0 +1,202 @@
+import numpy as np
+from numba import njit
+
+from white_elephant import VARIANT_CODES
+
+
+# Variant codes understood by `run_game`.
+NORMAL = VARIANT_CODES['normal']
+P1_EXTRA_TURN = VARIANT_CODES['p1_extra_turn']
+EARLY_PLAYER_SWAPS = VARIANT_CODES['early_player_swaps']
+
+
+@njit(cache=True)
+def _scan_best(bits_row, active_mask, floor_bits):
+    """
+    Return the most desirable active gift scoring above the floor, or -1.
+
+    Scores arrive as the int64 bit patterns of non-negative float64s, which
+    sort the same way as the floats themselves. That turns the scan into a
+    masked integer max reduction, which LLVM vectorizes (packed blend + max),
+    unlike a float argmax whose running index is a loop-carried dependency.
+    A second, early-exit pass then finds the lowest gift ID holding that
+    maximum. Callers mask out gifts the player may not take before scanning.
+    """
+    m = floor_bits
+    for g in range(bits_row.shape[0]):
+        v = bits_row[g] if active_mask[g] else floor_bits
+        m = max(m, v)
+
+    if m == floor_bits:
+        return -1
+
+    for g in range(bits_row.shape[0]):
+        if active_mask[g] and bits_row[g] == m:
+            return g
+    return -1
+
+
+@njit(cache=True)
+def _best_target(bits_row, active_mask, floor_bits, own_gift, just_stolen):
+    """
+    Return the best gift a player may steal above the floor, or -1.
+
+    The player's own gift and the gift just taken from them are masked out
+    for the duration of the scan.
+    """
+    own_active = own_gift >= 0 and active_mask[own_gift]
+    stolen_active = just_stolen >= 0 and active_mask[just_stolen]
+    if own_active:
+        active_mask[own_gift] = False
+    if stolen_active:
+        active_mask[just_stolen] = False
+
+    best = _scan_best(bits_row, active_mask, floor_bits)
+
+    if own_active:
+        active_mask[own_gift] = True
+    if stolen_active:
+        active_mask[just_stolen] = True
+    return best
+
+
+@njit(cache=True)
+def _swap(owner, held, steal_counts, active, lock_num, swapper, gift_id):
+    """
+    Swap `swapper`'s gift for `gift_id`, charging a steal to `gift_id`.
+    """
+    swappee = owner[gift_id]
+    worse_gift = held[swapper]
+
+    owner[gift_id] = swapper
+    held[swapper] = gift_id
+
+    owner[worse_gift] = swappee
+    held[swappee] = worse_gift
+
+    steal_counts[gift_id] += 1
+    if steal_counts[gift_id] >= lock_num:
+        active[gift_id] = False
+
+
+@njit(cache=True)
+def run_game(desir, thresholds, lock_num, variant_code, swap_card_thresh, seed):
+    """
+    Play a full White Elephant game on flat arrays.
+
+    Mirrors `WhiteElephantGame.run`, with steal chains handled by an
+    iterative state machine. Gifts that are held and not locked out are
+    tracked in a boolean mask so each steal decision is one `_scan_best`
+    over the bit patterns of the scores.
+
+    Parameters
+    ----------
+    desir : numpy.ndarray
+        `(n, n)` non-negative desirabilities; row i holds player i's score
+        for each gift.
+    thresholds : numpy.ndarray
+        `(n,)` non-negative stealing thresholds, one per player.
+    lock_num : int
+        Maximum number of steals before a gift locks.
+    variant_code : int
+        One of `NORMAL`, `P1_EXTRA_TURN` or `EARLY_PLAYER_SWAPS`.
+    swap_card_thresh : int
+        Number of early players given swap cards (`EARLY_PLAYER_SWAPS` only).
+    seed : int
+        Seed for the unwrap order. Negative values leave the RNG unseeded.
+
+    Returns
+    -------
+    owner : numpy.ndarray
+        `(n,)` int32 array mapping gift ID to the player holding it.
+    steal_counts : numpy.ndarray
+        `(n,)` int32 array of steals recorded against each gift.
+    swap_card : numpy.ndarray
+        `(n,)` bool array of players still holding an unused swap card.
+    """
+    if seed >= 0:
+        np.random.seed(seed)
+
+    n = desir.shape[0]
+    desir_bits = np.ascontiguousarray(desir).view(np.int64)
+    threshold_bits = np.ascontiguousarray(thresholds).view(np.int64)
+    owner = np.full(n, -1, dtype=np.int32)
+    held = np.full(n, -1, dtype=np.int32)
+    steal_counts = np.zeros(n, dtype=np.int32)
+    active = np.zeros(n, dtype=np.bool_)
+    wrapped = np.arange(n)
+    n_wrapped = n
+
+    swap_card = np.zeros(n, dtype=np.bool_)
+    if variant_code == EARLY_PLAYER_SWAPS:
+        swap_card[:max(0, min(swap_card_thresh, n))] = True
+
+    just_stolen = -1
+    for turn_player in range(n):
+        player = turn_player
+        while True:
+            best = _best_target(
+                desir_bits[player], active, threshold_bits[player],
+                held[player], just_stolen
+            )
+            just_stolen = -1
+
+            if best >= 0:
+                robbed = owner[best]
+                held[robbed] = -1
+                owner[best] = player
+                held[player] = best
+                steal_counts[best] += 1
+                if steal_counts[best] >= lock_num:
+                    active[best] = False
+                just_stolen = best
+                player = robbed
+                continue
+
+            idx = np.random.randint(0, n_wrapped)
+            gift_id = wrapped[idx]
+            wrapped[idx] = wrapped[n_wrapped - 1]
+            n_wrapped -= 1
+
+            owner[gift_id] = player
+            held[player] = gift_id
+            active[gift_id] = lock_num > 0
+
+            if variant_code == EARLY_PLAYER_SWAPS:
+                for p in range(n):
+                    if not swap_card[p] or held[p] < 0:
+                        continue
+                    if (
+                        desir[p, held[p]] < desir[p, gift_id]
+                        and thresholds[p] - 0.05 < desir[p, gift_id]
+                    ):
+                        swap_card[p] = False
+                        _swap(
+                            owner, held, steal_counts, active, lock_num,
+                            p, gift_id
+                        )
+                        break
+            break
+
+    if variant_code == P1_EXTRA_TURN:
+        best = _best_target(
+            desir_bits[0], active, desir_bits[0, held[0]], held[0], -1
+        )
+        if best >= 0:
+            _swap(owner, held, steal_counts, active, lock_num, 0, best)
+
+    return owner, steal_counts, swap_card
+
+
+def precompile():
+    """
+    Compile (or load from the on-disk cache) every kernel before timed runs.
+
+    Numba specializes on argument types rather than array sizes, so one
+    small dummy game per variant covers every `n_players`.
+    """
+    n = 4
+    desir = np.random.default_rng(0).uniform(0.0, 0.97, (n, n))
+    thresholds = np.full(n, 0.5)
+    for variant_code in VARIANT_CODES.values():
+        run_game(desir, thresholds, 2, variant_code, n, 0)